@@ -0,0 +1,55 @@
+"""initial schema
+
+Revision ID: 57ed2187e458
+Revises: 
+Create Date: 2026-08-30 19:56:30.703061
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '57ed2187e458'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('tryon_sessions',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_token', sa.String(length=255), nullable=False),
+    sa.Column('user_image_url', sa.Text(), nullable=False),
+    sa.Column('garment_image_url', sa.Text(), nullable=False),
+    sa.Column('output_image_url', sa.Text(), nullable=True),
+    sa.Column('garment_category', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.Enum('CREATED', 'PROCESSING', 'COMPLETED', 'FAILED', name='sessionstatus'), nullable=False),
+    sa.Column('error_reason', sa.Text(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_expires_status', 'tryon_sessions', ['expires_at', 'status'], unique=False)
+    op.create_index('idx_pending_created', 'tryon_sessions', ['created_at'], unique=False, postgresql_where=sa.text("status = 'CREATED'"), sqlite_where=sa.text("status = 'CREATED'"))
+    op.create_index('idx_status_created', 'tryon_sessions', ['status', 'created_at'], unique=False)
+    op.create_index('idx_user_created', 'tryon_sessions', ['user_token', 'created_at'], unique=False)
+    op.create_index(op.f('ix_tryon_sessions_created_at'), 'tryon_sessions', ['created_at'], unique=False)
+    op.create_index(op.f('ix_tryon_sessions_expires_at'), 'tryon_sessions', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_tryon_sessions_id'), 'tryon_sessions', ['id'], unique=False)
+    op.create_index(op.f('ix_tryon_sessions_status'), 'tryon_sessions', ['status'], unique=False)
+    op.create_index(op.f('ix_tryon_sessions_user_token'), 'tryon_sessions', ['user_token'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tryon_sessions_user_token'), table_name='tryon_sessions')
+    op.drop_index(op.f('ix_tryon_sessions_status'), table_name='tryon_sessions')
+    op.drop_index(op.f('ix_tryon_sessions_id'), table_name='tryon_sessions')
+    op.drop_index(op.f('ix_tryon_sessions_expires_at'), table_name='tryon_sessions')
+    op.drop_index(op.f('ix_tryon_sessions_created_at'), table_name='tryon_sessions')
+    op.drop_index('idx_user_created', table_name='tryon_sessions')
+    op.drop_index('idx_status_created', table_name='tryon_sessions')
+    op.drop_index('idx_pending_created', table_name='tryon_sessions', postgresql_where=sa.text("status = 'CREATED'"), sqlite_where=sa.text("status = 'CREATED'"))
+    op.drop_index('idx_expires_status', table_name='tryon_sessions')
+    op.drop_table('tryon_sessions')
@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, load_only, raiseload
 
+from app.config import settings
 from app.models import SessionStatus, TryOnSession
 
 
+def _utcnow() -> datetime:
+    """Current UTC time, naive — matching the DB's timestamp columns.
+
+    datetime.utcnow() is deprecated since Python 3.12; this keeps a single
+    replacement so bulk callers can also capture one timestamp per batch.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def create_session(
     db: Session,
     *,
@@ -19,13 +30,27 @@ def create_session(
     garment_image_url: str,
     garment_category: str = "upper_body",
 ) -> TryOnSession:
-    row = TryOnSession(
+    # expires_at is materialised at insert time so the cleanup predicate
+    # (expires_at < now) stays a plain indexed column comparison.
+    values = dict(
         user_token=user_token,
         user_image_url=user_image_url,
         garment_image_url=garment_image_url,
         garment_category=garment_category,
         status=SessionStatus.CREATED,
+        expires_at=_utcnow() + timedelta(hours=settings.session_expiry_hours),
     )
+
+    # INSERT ... RETURNING writes and reads the row in one round trip
+    # (PostgreSQL, SQLite >= 3.35); otherwise fall back to add/commit/refresh.
+    if db.get_bind().dialect.insert_returning:
+        row = db.execute(
+            insert(TryOnSession).values(**values).returning(TryOnSession)
+        ).scalar_one()
+        db.commit()
+        return row
+
+    row = TryOnSession(**values)
     db.add(row)
     db.commit()
     db.refresh(row)
@@ -33,12 +58,27 @@ def create_session(
 
 
 def get_session(db: Session, session_id: uuid.UUID) -> Optional[TryOnSession]:
-    return db.query(TryOnSession).filter(TryOnSession.id == session_id).first()
+    # Session.get() checks the identity map first, so repeat lookups within
+    # one unit of work skip SQL entirely. raiseload('*') makes any future
+    # lazy-loaded relationship fail loudly instead of silently issuing N+1
+    # queries; relationships must be eager-loaded explicitly at the query site.
+    return db.get(TryOnSession, session_id, options=[raiseload("*")])
+
+
+# Minimal column set hydrated by the list helpers below; full rows are only
+# loaded by get_session. Avoids fetching image URLs / error text per row.
+_LIST_COLUMNS = (
+    TryOnSession.id,
+    TryOnSession.status,
+    TryOnSession.created_at,
+    TryOnSession.expires_at,
+)
 
 
 def get_sessions_by_user(db: Session, user_token: str, limit: int = 10) -> List[TryOnSession]:
     return (
         db.query(TryOnSession)
+        .options(load_only(*_LIST_COLUMNS))
         .filter(TryOnSession.user_token == user_token)
         .order_by(TryOnSession.created_at.desc())
         .limit(limit)
@@ -53,30 +93,87 @@ def update_session_status(
     *,
     output_image_url: Optional[str] = None,
     error_reason: Optional[str] = None,
-) -> Optional[TryOnSession]:
-    row = get_session(db, session_id)
-    if not row:
-        return None
-    row.status = status
+) -> int:
+    """Update a session's status in a single UPDATE statement.
+
+    Returns the number of rows matched (0 when the session does not exist).
+    Callers that need the row afterwards should call :func:`get_session`.
+    """
+    # updated_at is maintained by the column's onupdate=func.now()
+    values = {TryOnSession.status: status}
     if output_image_url:
-        row.output_image_url = output_image_url
+        values[TryOnSession.output_image_url] = output_image_url
     if error_reason:
-        row.error_reason = error_reason
-    row.updated_at = datetime.utcnow()
+        values[TryOnSession.error_reason] = error_reason
+
+    updated = (
+        db.query(TryOnSession)
+        .filter(TryOnSession.id == session_id)
+        .update(values, synchronize_session=False)
+    )
     db.commit()
-    db.refresh(row)
-    return row
+    return updated
 
 
 def get_expired_sessions(db: Session, limit: int = 100) -> List[TryOnSession]:
+    # Cleanup only needs the id plus the file URLs to unlink.
     return (
         db.query(TryOnSession)
-        .filter(TryOnSession.expires_at < datetime.utcnow())
+        .options(
+            load_only(
+                TryOnSession.id,
+                TryOnSession.user_image_url,
+                TryOnSession.garment_image_url,
+                TryOnSession.output_image_url,
+            )
+        )
+        .filter(TryOnSession.expires_at < _utcnow())
         .limit(limit)
         .all()
     )
 
 
+def delete_sessions_by_ids(db: Session, session_ids: List[uuid.UUID]) -> int:
+    """Delete a batch of sessions with a single bulk DELETE statement."""
+    if not session_ids:
+        return 0
+    deleted = (
+        db.query(TryOnSession)
+        .filter(TryOnSession.id.in_(session_ids))
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def bulk_delete_expired(db: Session, *, batch_size: int = 1000) -> int:
+    """Delete all expired sessions with batched bulk DELETEs.
+
+    Avoids hydrating ORM rows just to discard them; each round removes at
+    most ``batch_size`` rows so no single statement holds locks for long.
+    Returns the total number of rows deleted.
+    """
+    # One timestamp for the whole sweep — every batch shares the same cutoff.
+    now = _utcnow()
+    total = 0
+    while True:
+        batch = (
+            select(TryOnSession.id)
+            .where(TryOnSession.expires_at < now)
+            .limit(batch_size)
+            .subquery()
+        )
+        deleted = (
+            db.query(TryOnSession)
+            .filter(TryOnSession.id.in_(select(batch.c.id)))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
 def delete_session(db: Session, session_id: uuid.UUID) -> bool:
     row = get_session(db, session_id)
     if not row:
@@ -89,6 +186,7 @@ def delete_session(db: Session, session_id: uuid.UUID) -> bool:
 def get_pending_sessions(db: Session, limit: int = 50) -> List[TryOnSession]:
     return (
         db.query(TryOnSession)
+        .options(load_only(*_LIST_COLUMNS))
         .filter(TryOnSession.status == SessionStatus.CREATED)
         .order_by(TryOnSession.created_at.asc())
         .limit(limit)
@@ -12,23 +12,35 @@ On import this module exposes:
 from __future__ import annotations
 
 import logging
+import time
+from pathlib import Path
 from typing import Optional, Tuple
 
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Snapshot hot settings once — pydantic attribute access is not free, and the
+# masked URL (credentials stripped for logging) never changes at runtime.
+_DB_URL = settings.database_url
+_MASKED_DB_URL = _DB_URL.split("@", 1)[-1] if "@" in _DB_URL else _DB_URL
+
 # ---------------------------------------------------------------------------
 # Module-level state
 # ---------------------------------------------------------------------------
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base shared by all ORM models."""
+
 
 engine = None
 SessionLocal: Optional[sessionmaker] = None
+# Thread-local session registry for the worker pool: each worker thread
+# keeps one session (and its pooled connection) across jobs instead of
+# constructing a new one per session processed.
+ScopedSession: Optional[scoped_session] = None
 db_type: Optional[str] = None
 _db_healthy = False
 
@@ -38,25 +50,38 @@ _db_healthy = False
 # ---------------------------------------------------------------------------
 def create_database_engine() -> Tuple[bool, str]:
     """Try PostgreSQL first; fall back to SQLite on failure."""
-    global engine, SessionLocal, db_type, _db_healthy
+    global engine, SessionLocal, ScopedSession, db_type, _db_healthy
 
     # --- Attempt PostgreSQL ---
     try:
-        masked_url = settings.database_url.split("@")[-1] if "@" in settings.database_url else settings.database_url
-        logger.info("Connecting to PostgreSQL (%s) …", masked_url)
+        logger.info("Connecting to PostgreSQL (%s) …", _MASKED_DB_URL)
 
         pg_engine = create_engine(
-            settings.database_url,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-            connect_args={"connect_timeout": 5},
+            _DB_URL,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            connect_args={
+                "connect_timeout": 5,
+                # Bound worst-case queries / lock waits server-side so one
+                # runaway statement cannot pin a pooled connection forever.
+                "options": (
+                    f"-c statement_timeout={settings.db_statement_timeout_ms} "
+                    f"-c lock_timeout={settings.db_lock_timeout_ms}"
+                ),
+            },
         )
-        with pg_engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        if settings.db_probe_on_startup:
+            with pg_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
 
         engine = pg_engine
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+        )
+        ScopedSession = scoped_session(SessionLocal)
         db_type = "postgresql"
         _db_healthy = True
         logger.info("PostgreSQL connection OK")
@@ -70,10 +95,26 @@ def create_database_engine() -> Tuple[bool, str]:
     try:
         sqlite_url = "sqlite:///./dev.db"
         engine = create_engine(sqlite_url, connect_args={"check_same_thread": False})
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
 
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        @event.listens_for(engine, "connect")
+        def _sqlite_pragmas(dbapi_conn, _record):
+            # WAL lets readers proceed during the cleanup sweep's writes;
+            # synchronous=NORMAL batches fsyncs instead of one per commit.
+            cur = dbapi_conn.cursor()
+            cur.execute("PRAGMA journal_mode=WAL")
+            cur.execute("PRAGMA synchronous=NORMAL")
+            cur.execute("PRAGMA temp_store=MEMORY")
+            cur.execute("PRAGMA busy_timeout=5000")
+            cur.close()
+
+        if settings.db_probe_on_startup:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+        )
+        ScopedSession = scoped_session(SessionLocal)
         db_type = "sqlite"
         _db_healthy = True
         logger.warning("Using SQLite (./dev.db) — DEVELOPMENT ONLY")
@@ -86,31 +127,26 @@ def create_database_engine() -> Tuple[bool, str]:
 
 
 # ---------------------------------------------------------------------------
-# Schema helpers (SQLite only)
+# Migrations (SQLite dev convenience; production migrates out-of-band)
 # ---------------------------------------------------------------------------
-def _schema_needs_rebuild() -> bool:
-    """Return True when the SQLite schema is stale (missing expected columns)."""
-    if not engine or db_type != "sqlite":
-        return False
-    try:
-        inspector = inspect(engine)
-        if "tryon_sessions" not in inspector.get_table_names():
-            return False
-        columns = {col["name"] for col in inspector.get_columns("tryon_sessions")}
-        return bool({"user_image_url", "garment_image_url"} - columns)
-    except Exception:
-        return False
+def _run_migrations() -> None:
+    """Bring the dev database to the latest Alembic revision.
 
+    Databases created by create_all before Alembic was introduced are
+    stamped to head instead of re-running the initial migration.
+    """
+    from alembic import command
+    from alembic.config import Config as AlembicConfig
 
-def _rebuild_sqlite_schema() -> bool:
-    """Drop + recreate all tables in SQLite (dev convenience)."""
-    if db_type != "sqlite":
-        return False
-    logger.warning("Rebuilding SQLite schema …")
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    logger.info("SQLite schema rebuilt successfully")
-    return True
+    backend_dir = Path(__file__).resolve().parent.parent
+    cfg = AlembicConfig(str(backend_dir / "alembic.ini"))
+    cfg.set_main_option("script_location", str(backend_dir / "alembic"))
+    cfg.set_main_option("sqlalchemy.url", str(engine.url))
+
+    inspector = inspect(engine)
+    if inspector.has_table("tryon_sessions") and not inspector.has_table("alembic_version"):
+        command.stamp(cfg, "head")
+    command.upgrade(cfg, "head")
 
 
 # ---------------------------------------------------------------------------
@@ -123,8 +159,11 @@ def initialize_database() -> bool:
         logger.error("Cannot initialise DB — engine not created")
         return False
     try:
-        if _schema_needs_rebuild():
-            _rebuild_sqlite_schema()
+        if db_type == "sqlite" and settings.debug:
+            # Dev convenience: apply migrations in-process instead of the old
+            # inspect + drop_all/create_all rebuild. Production databases are
+            # migrated out-of-band (alembic upgrade head).
+            _run_migrations()
         else:
             Base.metadata.create_all(bind=engine)
         _db_healthy = True
@@ -136,16 +175,31 @@ def initialize_database() -> bool:
         return False
 
 
+# Health probes arrive every few seconds from load balancers; cache the
+# SELECT 1 result briefly so they don't each cost a DB round trip.
+_HEALTH_TTL_SECONDS = 5.0
+_health_cache: Tuple[float, bool] = (0.0, False)
+
+
 def check_db_health() -> bool:
-    """Lightweight ping used by the /health endpoint."""
+    """Lightweight ping used by the /health endpoint (TTL-cached)."""
+    global _health_cache
     if not engine or not _db_healthy:
         return False
+
+    checked_at, healthy = _health_cache
+    now = time.monotonic()
+    if now - checked_at < _HEALTH_TTL_SECONDS:
+        return healthy
+
     try:
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
-        return True
+        healthy = True
     except Exception:
-        return False
+        healthy = False
+    _health_cache = (now, healthy)
+    return healthy
 
 
 # ---------------------------------------------------------------------------
@@ -8,11 +8,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -23,33 +28,40 @@ from app.config import settings
 from app.database import check_db_health, create_database_engine, initialize_database
 from app.middleware.logging import LoggingMiddleware
 from app.routers import tryon
-from app.services.cleanup import cleanup_expired_sessions
 
 # ---------------------------------------------------------------------------
-# Logging
+# Logging — handlers run on a dedicated listener thread so request-path
+# logger calls only enqueue a record instead of hitting file/stdout I/O.
 # ---------------------------------------------------------------------------
+_log_queue: SimpleQueue = SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler("tryon_api.log"),
+    logging.StreamHandler(),
+    respect_handler_level=True,
+)
+_log_listener.start()
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s  %(name)-28s  %(levelname)-8s  %(message)s",
-    handlers=[
-        logging.FileHandler("tryon_api.log"),
-        logging.StreamHandler(),
-    ],
+    handlers=[QueueHandler(_log_queue)],
 )
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Database engine (tables created in startup event)
-# ---------------------------------------------------------------------------
-create_database_engine()
-
 # Upload directory
 Path(settings.upload_dir).mkdir(parents=True, exist_ok=True)
 
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
-limiter = Limiter(key_func=get_remote_address)
+# With a redis_url configured the counters live in Redis (atomic sliding
+# window shared across workers); otherwise each worker keeps its own.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.redis_url or "memory://",
+    strategy="moving-window",
+)
 
 app = FastAPI(
     title="TryOnAI API",
@@ -57,11 +69,16 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Added before CORS so it compresses final response bodies; already-small
+# payloads (and image thumbnails) stay below the threshold untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -69,14 +86,32 @@ app.add_middleware(
         "https://try-on-ai-blue.vercel.app",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # A closed allow-list lets the middleware short-circuit preflights, and
+    # max_age lets browsers cache the preflight result for a day.
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+    max_age=86400,
 )
 
 app.add_middleware(LoggingMiddleware)
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with long-lived Cache-Control on every file response.
+
+    Upload filenames embed the session UUID, so contents never change for a
+    given URL and clients/CDNs can cache aggressively (ETag/Range handling
+    comes from StaticFiles itself). Bulk image serving still belongs on a
+    reverse proxy or object store in front of this app.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=604800, immutable")
+        return response
+
+
 upload_path = Path(settings.upload_dir).resolve()
-app.mount("/uploads", StaticFiles(directory=str(upload_path)), name="uploads")
+app.mount("/uploads", CachedStaticFiles(directory=str(upload_path)), name="uploads")
 
 app.include_router(tryon.router, prefix="/api")
 
@@ -86,6 +121,20 @@ app.include_router(tryon.router, prefix="/api")
 # ---------------------------------------------------------------------------
 @app.on_event("startup")
 async def startup_event():
+    # Engine creation (and the cleanup import behind it) happens here rather
+    # than at module import, keeping cold starts and plain `import app.main`
+    # free of database IO.
+    import anyio
+
+    from app.services.cleanup import cleanup_expired_sessions
+
+    # Sync endpoints (the session GETs) run on this threadpool; the anyio
+    # default of 40 tokens caps how many pollers can wait on the DB at once.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.request_threadpool_size
+    )
+
+    create_database_engine()
     initialize_database()
     asyncio.create_task(cleanup_expired_sessions())
     logger.info("=" * 60)
@@ -95,26 +144,55 @@ async def startup_event():
     logger.info("=" * 60)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.services.worker import worker
+
+    worker.shutdown()
+    # Flush any queued log records before the process exits.
+    _log_listener.stop()
+
+
 # ---------------------------------------------------------------------------
 # Root / health
 # ---------------------------------------------------------------------------
+# The root payload never changes — serialize it once at import time.
+_ROOT_JSON = orjson.dumps(
+    {"service": "TryOnAI API", "status": "healthy", "version": "1.0.0"}
+)
+
+
 @app.get("/")
 async def root():
-    return {"service": "TryOnAI API", "status": "healthy", "version": "1.0.0"}
+    return Response(content=_ROOT_JSON, media_type="application/json")
+
+
+# Load balancers and liveness probes hammer /api/health; serve a cached body
+# for a couple of seconds instead of recomputing per hit.
+_HEALTH_TTL_SECONDS = 2.0
+_health_cache: tuple[float, bytes] = (0.0, b"")
 
 
 @app.get("/api/health")
 async def health_check():
-    healthy = check_db_health()
-    return {
-        "status": "healthy" if healthy else "degraded",
-        "database": {
-            "type": db_module.db_type or "not_initialised",
-            "connected": healthy,
-            "warning": "SQLite — dev only" if db_module.db_type == "sqlite" else None,
-        },
-        "version": "1.0.0",
-    }
+    global _health_cache
+    cached_at, body = _health_cache
+    now = time.monotonic()
+    if not body or now - cached_at >= _HEALTH_TTL_SECONDS:
+        healthy = check_db_health()
+        body = orjson.dumps(
+            {
+                "status": "healthy" if healthy else "degraded",
+                "database": {
+                    "type": db_module.db_type or "not_initialised",
+                    "connected": healthy,
+                    "warning": "SQLite — dev only" if db_module.db_type == "sqlite" else None,
+                },
+                "version": "1.0.0",
+            }
+        )
+        _health_cache = (now, body)
+    return Response(content=body, media_type="application/json")
 
 
 @app.exception_handler(Exception)
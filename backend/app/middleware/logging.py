@@ -3,32 +3,63 @@
 from __future__ import annotations
 
 import logging
+import os
 import time
-import uuid
-
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
+# Hoisted so the per-request branch is a frozenset lookup + one startswith
+# against module constants.
+_SESSION_PREFIX = "/api/tryon/sessions"
+_STATE_METHODS = frozenset({"POST", "PATCH", "PUT"})
+
+
+class LoggingMiddleware:
+    """Attach a unique request-id and log request + response timing.
+
+    Implemented as a pure ASGI callable rather than BaseHTTPMiddleware —
+    the latter wraps every request in extra coroutines/tasks and costs
+    measurable throughput on an I/O-bound app.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 8 hex chars of raw entropy — same collision profile as the old
+        # uuid4 slice without building and formatting a UUID object.
+        req_id = os.urandom(4).hex()
+        scope.setdefault("state", {})["request_id"] = req_id
+        start = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Attach a unique request-id and log request + response timing."""
+        logger.info("[%s] %s %s", req_id, method, path)
 
-    async def dispatch(self, request: Request, call_next):
-        req_id = str(uuid.uuid4())[:8]
-        request.state.request_id = req_id
-        start = time.time()
+        # Session state changes get an extra log line; a branch here is far
+        # cheaper than a second middleware layer for the same observability.
+        if method in _STATE_METHODS and path.startswith(_SESSION_PREFIX):
+            logger.info("[%s] session state change: %s %s", req_id, method, path)
 
-        logger.info("[%s] %s %s", req_id, request.method, request.url.path)
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", []).append(
+                    (b"x-request-id", req_id.encode())
+                )
+                logger.info(
+                    "[%s] %s in %.3fs", req_id, message["status"], time.perf_counter() - start
+                )
+            await send(message)
 
         try:
-            response = await call_next(request)
-            elapsed = time.time() - start
-            logger.info("[%s] %s in %.3fs", req_id, response.status_code, elapsed)
-            response.headers["X-Request-ID"] = req_id
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            elapsed = time.time() - start
-            logger.error("[%s] Error after %.3fs: %s", req_id, elapsed, exc, exc_info=True)
+            logger.error(
+                "[%s] Error after %.3fs: %s", req_id, time.perf_counter() - start, exc,
+                exc_info=True,
+            )
             raise
@@ -2,12 +2,13 @@
 
 import enum
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Column, DateTime, Enum, Index, String, Text
+from sqlalchemy import DateTime, Enum, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.config import settings
 from app.database import Base
 
 
@@ -21,35 +22,49 @@ class SessionStatus(str, enum.Enum):
 class TryOnSession(Base):
     __tablename__ = "tryon_sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    user_token = Column(String(255), nullable=False, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
+    )
+    user_token: Mapped[str] = mapped_column(String(255), index=True)
 
     # Image URLs (relative, e.g. /uploads/users/<uuid>_user.jpg)
-    user_image_url = Column(Text, nullable=False)
-    garment_image_url = Column(Text, nullable=False)
-    output_image_url = Column(Text, nullable=True)
+    user_image_url: Mapped[str] = mapped_column(Text)
+    garment_image_url: Mapped[str] = mapped_column(Text)
+    output_image_url: Mapped[Optional[str]] = mapped_column(Text)
 
     # Garment category: upper_body, lower_body, dresses
-    garment_category = Column(String(20), default="upper_body", nullable=False)
+    garment_category: Mapped[str] = mapped_column(String(20), default="upper_body")
 
-    status = Column(Enum(SessionStatus), default=SessionStatus.CREATED, nullable=False, index=True)
-    error_reason = Column(Text, nullable=True)
+    status: Mapped[SessionStatus] = mapped_column(
+        Enum(SessionStatus), default=SessionStatus.CREATED, index=True
+    )
+    error_reason: Mapped[Optional[str]] = mapped_column(Text)
 
-    expires_at = Column(DateTime, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    # Timestamps are populated server-side so inserts/updates need no extra
+    # Python-level datetime work.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), index=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
 
     __table_args__ = (
         Index("idx_status_created", "status", "created_at"),
         Index("idx_expires_status", "expires_at", "status"),
+        # get_sessions_by_user filters on user_token and orders by created_at
+        Index("idx_user_created", "user_token", "created_at"),
+        # Partial index covering get_pending_sessions (status == CREATED)
+        Index(
+            "idx_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'CREATED'"),
+            sqlite_where=text("status = 'CREATED'"),
+        ),
     )
 
     # Backward-compat alias
     @property
     def input_image_url(self) -> str:
         return self.user_image_url
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        if not self.expires_at:
-            self.expires_at = datetime.utcnow() + timedelta(hours=settings.session_expiry_hours)
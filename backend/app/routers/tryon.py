@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
+from types import MappingProxyType
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
 from sqlalchemy.orm import Session
 
 from app.crud import create_session, get_session
@@ -22,21 +25,41 @@ router = APIRouter(prefix="/tryon", tags=["try-on"])
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-PROGRESS_MESSAGES = {
+# Read-only view — covers every SessionStatus member, so lookups can index
+# directly; a new status without a message fails loudly instead of yielding
+# None in responses.
+PROGRESS_MESSAGES = MappingProxyType({
     SessionStatus.CREATED: "Session created, queued for processing…",
     SessionStatus.PROCESSING: "AI model is generating your try-on — this takes 1–2 minutes…",
     SessionStatus.COMPLETED: "Try-on completed successfully!",
     SessionStatus.FAILED: "Processing failed. Please try again.",
-}
+})
 
 
-def _absolute_url(request: Request, relative: str | None) -> str | None:
-    """Convert a relative upload path to an absolute URL."""
-    if not relative or relative.startswith(("http://", "https://")):
-        return relative
+# The frontend polls GET /sessions/{id} every 1-2s while the worker runs for
+# minutes; a short TTL cache turns most of those polls into a dict lookup.
+# A state transition is visible at most one TTL late, which the polling
+# cadence already tolerates. The cache is cleared wholesale if it ever grows
+# past the cap (entries expire naturally within the TTL anyway).
+_STATUS_TTL_SECONDS = 1.0
+_STATUS_CACHE_MAX = 10_000
+_status_cache: dict[uuid.UUID, tuple[float, SessionStatusResponse]] = {}
+
+_ABSOLUTE_PREFIXES = ("http://", "https://")
+
+
+def _request_base(request: Request) -> str:
+    """Base URL for absolute links — compute once per request, not per URL."""
     base = str(request.base_url).rstrip("/")
     if base.endswith("/api"):
         base = base[:-4]
+    return base
+
+
+def _absolute_url(base: str, relative: str | None) -> str | None:
+    """Convert a relative upload path to an absolute URL."""
+    if not relative or relative.startswith(_ABSOLUTE_PREFIXES):
+        return relative
     return f"{base}{relative}"
 
 
@@ -45,7 +68,6 @@ def _absolute_url(request: Request, relative: str | None) -> str | None:
 # ---------------------------------------------------------------------------
 @router.post("/sessions", response_model=UploadResponse, status_code=201)
 async def create_tryon_session(
-    background_tasks: BackgroundTasks,
     user_image: UploadFile = File(..., description="User photo"),
     garment_image: UploadFile = File(..., description="Garment image"),
     user_token: str = Form(..., description="Anonymous user identifier"),
@@ -67,15 +89,20 @@ async def create_tryon_session(
             garment_category=category,
         )
 
-        user_url = await storage_service.save_user_image(user_image, session.id)
-        garment_url = await storage_service.save_garment_image(garment_image, session.id)
+        # The two saves are independent I/O — run them concurrently.
+        user_url, garment_url = await asyncio.gather(
+            storage_service.save_user_image(user_image, session.id),
+            storage_service.save_garment_image(garment_image, session.id),
+        )
 
         session.user_image_url = user_url
         session.garment_image_url = garment_url
         db.commit()
         db.refresh(session)
 
-        background_tasks.add_task(worker.process_session, session.id)
+        # Hand off to the persistent worker pool — the response does not
+        # wait on (or share a threadpool with) the try-on job.
+        worker.submit(session.id)
         logger.info("Session %s created for user %s", session.id, user_token)
 
         return UploadResponse(
@@ -91,27 +118,36 @@ async def create_tryon_session(
 
 
 @router.get("/sessions/{session_id}", response_model=SessionStatusResponse)
-async def get_session_status(
+def get_session_status(
     session_id: uuid.UUID,
     request: Request,
     db: Session = Depends(get_db),
 ):
     """Poll the current status of a try-on session."""
+    now = time.monotonic()
+    cached = _status_cache.get(session_id)
+    if cached is not None and now - cached[0] < _STATUS_TTL_SECONDS:
+        return cached[1]
+
     session = get_session(db, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return SessionStatusResponse(
+    resp = SessionStatusResponse(
         id=session.id,
         status=session.status,
-        output_image_url=_absolute_url(request, session.output_image_url),
+        output_image_url=_absolute_url(_request_base(request), session.output_image_url),
         error_reason=session.error_reason,
-        progress_message=PROGRESS_MESSAGES.get(session.status),
+        progress_message=PROGRESS_MESSAGES[session.status],
     )
+    if len(_status_cache) >= _STATUS_CACHE_MAX:
+        _status_cache.clear()
+    _status_cache[session_id] = (now, resp)
+    return resp
 
 
 @router.get("/sessions/{session_id}/details", response_model=SessionDetailResponse)
-async def get_session_details(
+def get_session_details(
     session_id: uuid.UUID,
     request: Request,
     db: Session = Depends(get_db),
@@ -121,8 +157,19 @@ async def get_session_details(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    resp = SessionDetailResponse.model_validate(session)
-    resp.user_image_url = _absolute_url(request, session.user_image_url)
-    resp.garment_image_url = _absolute_url(request, session.garment_image_url)
-    resp.output_image_url = _absolute_url(request, session.output_image_url)
-    return resp
+    base = _request_base(request)
+    # The values come straight from our own ORM row — model_construct skips
+    # the per-field validation pass that model_validate would re-run.
+    return SessionDetailResponse.model_construct(
+        id=session.id,
+        user_token=session.user_token,
+        status=session.status,
+        user_image_url=_absolute_url(base, session.user_image_url),
+        garment_image_url=_absolute_url(base, session.garment_image_url),
+        output_image_url=_absolute_url(base, session.output_image_url),
+        garment_category=session.garment_category,
+        error_reason=session.error_reason,
+        created_at=session.created_at,
+        updated_at=session.updated_at,
+        expires_at=session.expires_at,
+    )
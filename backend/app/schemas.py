@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models import SessionStatus
 
@@ -26,17 +26,18 @@ class UploadResponse(BaseModel):
 
 
 class SessionStatusResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     status: SessionStatus
     output_image_url: Optional[str] = None
     error_reason: Optional[str] = None
     progress_message: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class SessionDetailResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     user_token: str
     status: SessionStatus
@@ -48,6 +49,3 @@ class SessionDetailResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     expires_at: datetime
-
-    class Config:
-        from_attributes = True
@@ -5,13 +5,18 @@ from __future__ import annotations
 import asyncio
 import logging
 
+import app.database as db_module
 from app.config import settings
-from app.crud import delete_session, get_expired_sessions
-from app.database import SessionLocal
+from app.crud import delete_sessions_by_ids, get_expired_sessions
 from app.services.storage import storage_service
 
 logger = logging.getLogger(__name__)
 
+# Guards against overlapping sweeps if the coroutine is ever scheduled twice
+# (e.g. duplicate startup hooks). Cleanup must only run from this background
+# task — never inline in a request handler.
+_cleanup_lock = asyncio.Lock()
+
 
 async def cleanup_expired_sessions() -> None:
     """Long-running background coroutine — deletes expired sessions hourly."""
@@ -19,25 +24,40 @@ async def cleanup_expired_sessions() -> None:
 
     while True:
         try:
-            if SessionLocal is None:
+            if db_module.SessionLocal is None:
                 logger.warning("Cleanup: database not ready, skipping cycle")
                 await asyncio.sleep(interval)
                 continue
 
-            db = SessionLocal()
-            try:
-                expired = get_expired_sessions(db, limit=100)
-                if expired:
-                    logger.info("Cleaning up %d expired session(s)", len(expired))
-                for s in expired:
-                    storage_service.delete_session_files(
-                        s.user_image_url, s.garment_image_url, s.output_image_url
-                    )
-                    delete_session(db, s.id)
-            finally:
-                db.close()
+            async with _cleanup_lock:
+                await _sweep_once()
 
         except Exception as exc:
             logger.error("Cleanup error: %s", exc, exc_info=True)
 
         await asyncio.sleep(interval)
+
+
+async def _sweep_once() -> None:
+    """Run one cleanup sweep: delete expired sessions and their files."""
+    db = db_module.SessionLocal()
+    try:
+        # Remove files first (while the rows still exist), then drop
+        # the rows themselves in bulk instead of one DELETE per row.
+        while True:
+            expired = get_expired_sessions(db, limit=100)
+            if not expired:
+                break
+            ids = [s.id for s in expired]
+            # One directory scan per category for the whole batch, off the
+            # event loop — instead of stat+unlink per recorded URL.
+            await asyncio.to_thread(storage_service.delete_files_for_sessions, ids)
+            deleted = delete_sessions_by_ids(db, ids)
+            logger.info("Cleaned up %d expired session(s)", deleted)
+            if deleted <= 0:
+                break
+            # Brief pause between batches keeps each DELETE's lock window
+            # short and lets regular request traffic interleave.
+            await asyncio.sleep(0.05)
+    finally:
+        db.close()
@@ -6,7 +6,10 @@ HuggingFace Space via gradio_client.
 from __future__ import annotations
 
 import logging
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from gradio_client import Client, handle_file
 
@@ -20,14 +23,49 @@ logger = logging.getLogger(__name__)
 
 
 class TryOnWorker:
-    """Synchronous session processor invoked as a FastAPI BackgroundTask."""
+    """Synchronous session processor running on a dedicated thread pool.
+
+    BackgroundTasks ran jobs on the request threadpool, competing with sync
+    endpoints for tokens and offering no concurrency cap of their own. A
+    persistent executor bounds in-flight jobs to worker_concurrency and
+    keeps its threads (and anything cached on them) alive across sessions.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.worker_concurrency,
+            thread_name_prefix="tryon-worker",
+        )
+        self._client: Optional[Client] = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> Client:
+        """Shared gradio client, created on first use.
+
+        Constructing a Client handshakes with the Space and fetches its API
+        schema — hundreds of ms that used to be paid on every session.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = Client(settings.hf_space)
+        return self._client
+
+    def submit(self, session_id: uuid.UUID) -> None:
+        """Queue a session for processing; returns immediately."""
+        self._executor.submit(self.process_session, session_id)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     def process_session(self, session_id: uuid.UUID) -> None:
-        if db_module.SessionLocal is None:
+        if db_module.ScopedSession is None:
             logger.error("Worker: database not initialised — skipping session %s", session_id)
             return
 
-        db = db_module.SessionLocal()
+        # The scoped session is thread-local: each pool thread reuses its
+        # session (and pooled connection) across jobs.
+        db = db_module.ScopedSession()
         try:
             session = get_session(db, session_id)
             if not session:
@@ -36,9 +74,10 @@ class TryOnWorker:
 
             update_session_status(db, session_id, SessionStatus.PROCESSING)
 
-            # Resolve absolute file paths from relative upload URLs
-            user_img_path = str(storage_service.get_absolute_path(session.user_image_url))
-            garment_img_path = str(storage_service.get_absolute_path(session.garment_image_url))
+            # Resolve absolute file paths from relative upload URLs;
+            # handle_file accepts path-like objects, no str() round-trip.
+            user_img_path = storage_service.get_absolute_path(session.user_image_url)
+            garment_img_path = storage_service.get_absolute_path(session.garment_image_url)
             category = getattr(session, "garment_category", "upper_body") or "upper_body"
 
             logger.info(
@@ -47,7 +86,7 @@ class TryOnWorker:
             )
 
             # Call the Change-Clothes-AI Gradio API
-            client = Client(settings.hf_space)
+            client = self._get_client()
             result = client.predict(
                 dict={"background": handle_file(user_img_path), "layers": [], "composite": None},
                 garm_img=handle_file(garment_img_path),
@@ -75,7 +114,9 @@ class TryOnWorker:
             except Exception:
                 pass
         finally:
-            db.close()
+            # Return the connection to the pool and reset the registry for
+            # this thread; the next job starts with a clean session.
+            db_module.ScopedSession.remove()
 
 
 worker = TryOnWorker()
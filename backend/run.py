@@ -2,11 +2,31 @@
 
 import uvicorn
 
+from app.config import settings
+
+# uvloop/httptools ship with uvicorn[standard] on Linux/macOS; fall back to
+# the stdlib loop and h11 where they are unavailable (e.g. Windows dev).
+try:
+    import httptools  # noqa: F401
+    import uvloop  # noqa: F401
+
+    _LOOP, _HTTP = "uvloop", "httptools"
+except ImportError:
+    _LOOP, _HTTP = "auto", "auto"
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info",
+        host=settings.host,
+        port=settings.port,
+        reload=settings.debug,
+        loop=_LOOP,
+        http=_HTTP,
+        # LoggingMiddleware already records per-request method/path/timing;
+        # uvicorn's INFO access log would duplicate it at real throughput cost.
+        access_log=False,
+        log_level="warning",
+        proxy_headers=False,
+        server_header=False,
+        date_header=False,
     )
@@ -1,15 +1,30 @@
 #!/usr/bin/env python3
 """Bootstrap script — create database tables outside of the running app."""
 
+import argparse
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import app.database as db_module  # noqa: E402
 from app.database import Base, create_database_engine, initialize_database  # noqa: E402
 from app.models import TryOnSession  # noqa: E402, F401 — registers the model
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="assume an empty database and skip the per-table existence checks",
+    )
+    args = parser.parse_args()
+
     create_database_engine()
-    initialize_database()
+    if args.fresh:
+        # checkfirst=False skips one has_table round trip per model — only
+        # safe when the schema is known to be absent.
+        Base.metadata.create_all(bind=db_module.engine, checkfirst=False)
+    else:
+        initialize_database()
     print("Database tables ready.")